@@ -0,0 +1,89 @@
+# Copyright (c) 2022, LE GOFF Vincent
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+
+# * Neither the name of ytranslate nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS
+# BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY,
+# OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""File-system helpers to find programs, templates and packets."""
+
+from functools import lru_cache
+import os
+from pathlib import Path
+from types import CodeType
+from typing import Iterator
+
+
+def iter_public_files(root: Path, suffix: str) -> Iterator[Path]:
+    """Iterate over the public files with a given suffix, recursively.
+
+    Files and directories whose name starts with an underscore are
+    private: they are ignored, and private directories are not even
+    explored.  A missing root directory contains no file.
+
+    Args:
+        root (Path): the directory to explore.
+        suffix (str): the file suffix, like ".py".
+
+    Yields:
+        file_path (Path): the path of a public file, under `root`.
+
+    """
+    directories = [root]
+    while directories:
+        directory = directories.pop()
+        try:
+            with os.scandir(directory) as iterator:
+                entries = list(iterator)
+        except (FileNotFoundError, NotADirectoryError):
+            continue
+
+        for entry in entries:
+            if entry.name.startswith("_"):
+                continue
+
+            if entry.is_dir(follow_symlinks=False):
+                directories.append(directory / entry.name)
+            elif entry.name.endswith(suffix) and entry.is_file():
+                yield directory / entry.name
+
+
+@lru_cache(maxsize=1024)
+def compile_file(path: str, mtime: float) -> CodeType:
+    """Compile a Python file, reusing the code if it hasn't changed.
+
+    The modification time is only part of the cache key: if the file
+    is modified, it will be compiled again.
+
+    Args:
+        path (str): the path to the Python file.
+        mtime (float): the file's modification time.
+
+    Returns:
+        code (CodeType): the compiled code, ready to be executed.
+
+    """
+    source = Path(path).read_text(encoding="utf-8")
+    return compile(source, path, "exec", dont_inherit=True)
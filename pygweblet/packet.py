@@ -29,21 +29,57 @@
 
 """Pygweblet websocket packet."""
 
-from asyncio import iscoroutinefunction
+from asyncio import ensure_future, iscoroutinefunction, wait
+from functools import lru_cache
 from inspect import isasyncgenfunction, signature
-import json
-from typing import Any, Callable, Dict, Type, TYPE_CHECKING, get_type_hints
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Dict,
+    List,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+    TypeVar,
+    get_type_hints,
+)
 
 from aiohttp import web
 from pydantic import BaseModel
 
+from pygweblet.serialization import dumps
+
 if TYPE_CHECKING:
     from pygweblet.websocket import PygWebWSRouter
 
+T = TypeVar("T", bound=Callable[..., Any])
+
+# Name of the handler parameter receiving the server's client session.
+CLIENT_SESSION = "client_session"
+
+
+class _PacketConfig:
+
+    """Configuration shared by all packet validators."""
+
+    arbitrary_types_allowed = True
+
 
 class PygWebPacket:
 
-    """A Pygweblet packet for a websocket entrypoint."""
+    """A Pygweblet packet for a websocket entrypoint.
+
+    Handlers can be coroutines or async generators.  Every dictionary
+    returned (or yielded) by a handler is sent to the client as one
+    JSON message.  Async generators decorated with `batched` have
+    their results grouped instead (see `batched` below).
+
+    A handler taking a `client_session` parameter receives the
+    server's shared `aiohttp.ClientSession` in it, to send HTTP
+    requests.  This parameter isn't read from the client's arguments.
+
+    """
 
     def __init__(
         self,
@@ -51,11 +87,17 @@ class PygWebPacket:
         path: str,
         handler: Callable[[], Any],
         validator: Type[BaseModel],
+        batch_size: int = 1,
+        batch_timeout: float = 0.001,
+        needs_session: bool = False,
     ):
         self.router = router
         self.path = path
         self.handler = handler
         self.validator = validator
+        self.batch_size = batch_size
+        self.batch_timeout = batch_timeout
+        self.needs_session = needs_session
 
     def __repr__(self) -> str:
         params = [
@@ -76,17 +118,74 @@ class PygWebPacket:
 
         """
         handler = self.handler
+        if self.needs_session:
+            arguments[CLIENT_SESSION] = self.router.server.client_session
+
         if iscoroutinefunction(handler):
             # Executes the coroutine and forwards the result.
             result = await handler(**arguments)
             if isinstance(result, dict):
-                await ws.send_str(json.dumps(result))
+                await ws.send_json(result, dumps=dumps)
         elif isasyncgenfunction(handler):
             # `handler` is an async generator, execute it and awaits
             # its termination.
-            async for result in handler(**arguments):
+            results = handler(**arguments)
+            if self.batch_size > 1:
+                await self._send_batches(ws, results)
+            else:
+                async for result in results:
+                    if isinstance(result, dict):
+                        await ws.send_json(result, dumps=dumps)
+
+    async def _send_batches(
+        self, ws: web.WebSocketResponse, results: AsyncIterator[Any]
+    ):
+        """Send the results of an async generator in batches.
+
+        Args:
+            ws (WebSocketResponse): the websocket response.
+            results (AsyncIterator): the async generator to consume.
+
+        """
+        batch: List[Dict[str, Any]] = []
+        pending = None
+        try:
+            while True:
+                if not batch and pending is None:
+                    # Nothing to send on timeout, wait for the generator.
+                    try:
+                        result = await results.__anext__()
+                    except StopAsyncIteration:
+                        break
+                else:
+                    if pending is None:
+                        pending = ensure_future(results.__anext__())
+
+                    timeout = self.batch_timeout if batch else None
+                    done, _ = await wait({pending}, timeout=timeout)
+                    if not done:
+                        # The generator is idle, send the incomplete batch.
+                        await ws.send_json(batch, dumps=dumps)
+                        batch = []
+                        continue
+
+                    task, pending = pending, None
+                    try:
+                        result = task.result()
+                    except StopAsyncIteration:
+                        break
+
                 if isinstance(result, dict):
-                    await ws.send_str(json.dumps(result))
+                    batch.append(result)
+                    if len(batch) >= self.batch_size:
+                        await ws.send_json(batch, dumps=dumps)
+                        batch = []
+        finally:
+            if pending is not None:
+                pending.cancel()
+
+        if batch:
+            await ws.send_json(batch, dumps=dumps)
 
     @classmethod
     def from_coroutine(
@@ -103,16 +202,96 @@ class PygWebPacket:
             packet (PygWebPacket): if successful, create a new packet.
 
         """
-        defaults = {
-            parameter.name: parameter.default
-            for parameter in signature(handler).parameters.values()
-            if parameter.default is not parameter.empty
-        }
-        hints = get_type_hints(handler)
-        hints.pop("return", None)
-        attributes = defaults
-        config = type("Config", (), {"arbitrary_types_allowed": True})
-        attributes["__annotations__"] = hints
-        attributes["Config"] = config
-        validator = type("Validator", (BaseModel,), attributes)
-        return PygWebPacket(router, path, handler, validator)
+        return cls(
+            router,
+            path,
+            handler,
+            _build_validator(handler),
+            batch_size=getattr(handler, "batch_size", 1),
+            batch_timeout=getattr(handler, "batch_timeout", 0.001),
+            needs_session=CLIENT_SESSION in signature(handler).parameters,
+        )
+
+
+def batched(size: int, timeout: float = 0.001) -> Callable[[T], T]:
+    """Decorator to send the results of an async generator in batches.
+
+    Up to `size` dictionaries yielded by the decorated handler are
+    sent in one message, as a JSON list.  An incomplete batch is sent
+    as soon as the generator hasn't yielded anything for `timeout`
+    seconds.  Clients of this packet have to expect lists:
+
+        from pygweblet.packet import batched
+
+        @batched(50)
+        async def stream(count: int):
+            for i in range(count):
+                yield {"value": i}
+
+    Args:
+        size (int): the maximum number of results in a batch.
+        timeout (float): the time to wait for more results, in seconds.
+
+    """
+
+    def decorator(handler: T) -> T:
+        handler.batch_size = size  # type: ignore
+        handler.batch_timeout = timeout  # type: ignore
+        return handler
+
+    return decorator
+
+
+def _build_validator(handler: Callable) -> Type[BaseModel]:
+    """Build the validator of a handler, from its signature and type hints.
+
+    Args:
+        handler (Coroutine): the handler itself.
+
+    Returns:
+        validator (Type[BaseModel]): the pydantic model to validate
+                arguments sent to this handler.
+
+    """
+    defaults = tuple(
+        (parameter.name, type(parameter.default), parameter.default)
+        for parameter in signature(handler).parameters.values()
+        if parameter.default is not parameter.empty
+        and parameter.name != CLIENT_SESSION
+    )
+    hints = get_type_hints(handler)
+    hints.pop("return", None)
+    hints.pop(CLIENT_SESSION, None)
+    shape = (tuple(hints.items()), defaults)
+    try:
+        return _validator_for(shape)
+    except TypeError:
+        # A type hint or default value isn't hashable, don't share.
+        return _validator_for.__wrapped__(shape)
+
+
+@lru_cache(maxsize=None)
+def _validator_for(
+    shape: Tuple[Tuple[Tuple[Any, ...], ...], ...]
+) -> Type[BaseModel]:
+    """Build a validator for a given shape of arguments.
+
+    Handlers with the same argument names, type hints and default
+    values share the same validator.
+
+    Args:
+        shape (tuple): a tuple of (hints, defaults), hints being
+                (name, hint) pairs and defaults being
+                (name, type, value) triples, so that `1` and `True`
+                don't compare equal.
+
+    Returns:
+        validator (Type[BaseModel]): the pydantic model to validate
+                arguments of this shape.
+
+    """
+    hints, defaults = shape
+    namespace = {name: default for name, _, default in defaults}
+    namespace["__annotations__"] = dict(hints)
+    namespace["Config"] = _PacketConfig
+    return type("Validator", (BaseModel,), namespace)
@@ -29,11 +29,22 @@
 
 """Pygweblet router."""
 
+from collections import ChainMap
 from inspect import signature
 from pathlib import Path
-from typing import Any, Callable, Dict, Optional, Set, Type, TYPE_CHECKING
-
-from aiohttp import web
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TYPE_CHECKING,
+)
+
+from aiohttp.web import Response
+from jinja2 import Template
 
 from pygweblet.parameter import RouteParameter
 
@@ -41,7 +52,17 @@ if TYPE_CHECKING:
     from pygweblet.router import PygWebRouter
 
 # Constants
-ACCEPT_POST_DATA = {"POST", "PUT"}
+ACCEPT_POST_DATA = frozenset({"POST", "PUT"})
+HTML_CONTENT_TYPE = "text/html"
+
+# Order of the parameter accessors, as built in `PygWebRoute.handle`.
+ACCESSOR_ORDER = (
+    RouteParameter.INSTANCE,
+    RouteParameter.DYNAMIC_PART,
+    RouteParameter.REQUEST,
+    RouteParameter.QUERY,
+    RouteParameter.QUERY_OR_POST,
+)
 
 
 class PygWebRoute:
@@ -83,10 +104,22 @@ class PygWebRoute:
         self.program_path = program_path
         self.program_params: Dict[str, RouteParameter] = {}
         self.program_params_kind: Set[RouteParameter] = set()
+        self._accessors: Tuple[Tuple[str, int], ...] = ()
+        self._needs_info = False
+        self._needs_query = False
+        self._needs_post = False
         self.template = template
+        self.template_obj: Optional[Template] = None
         if self.program:
             self._extrapolate_program_params()
 
+        # Programs without parameter are called directly.
+        self._no_params = (
+            self.program is not None
+            and not self.program_params
+            and self.program_class is None
+        )
+
     def _extrapolate_program_params(self):
         """Extrapolate program parameters to be sent to the handler."""
         parts = self.path.split("/")
@@ -120,7 +153,16 @@ class PygWebRoute:
             self.program_params[parameter.name] = kind
             self.program_params_kind.add(kind)
 
-    @property
+        # Prepare the plan followed by `handle` for every request.
+        kinds = self.program_params_kind
+        self._accessors = tuple(
+            (name, ACCESSOR_ORDER.index(kind))
+            for name, kind in self.program_params.items()
+        )
+        self._needs_info = RouteParameter.DYNAMIC_PART in kinds
+        self._needs_post = RouteParameter.QUERY_OR_POST in kinds
+        self._needs_query = self._needs_post or RouteParameter.QUERY in kinds
+
     def __repr__(self):
         return f"<Route({self.path!r}, method={self.method})>"
 
@@ -161,7 +203,10 @@ class PygWebRoute:
             request (Request): the request to handle.
 
         """
-        if self.program:
+        result = {}
+        if self._no_params:
+            result = await self.program()
+        elif self.program:
             # If needed, create a program class instance.
             instance = None
             kwargs = {}
@@ -170,34 +215,32 @@ class PygWebRoute:
                 instance.request = request
 
             # If necessary, load query parameters.
-            info, query, post = {}, {}, {}
-            if RouteParameter.DYNAMIC_PART in self.program_params_kind:
+            info, query, source = {}, {}, {}
+            if self._needs_info:
                 info = request.match_info
-            if RouteParameter.QUERY in self.program_params_kind:
+            if self._needs_query:
                 query = request.query
-            if RouteParameter.QUERY_OR_POST in self.program_params_kind:
-                post = await query.post()
-
-            for name, kind in self.program_params.items():
-                if kind is RouteParameter.INSTANCE:
-                    kwargs[name] = instance
-                elif kind is RouteParameter.DYNAMIC_PART:
-                    kwargs[name] = info.get(name)
-                elif kind is RouteParameter.REQUEST:
-                    kwargs[name] = request
-                elif kind is RouteParameter.QUERY:
-                    kwargs[name] = query.get(name)
-                elif kind is RouteParameter.QUERY_OR_POST:
-                    kwargs[name] = query.get(name) or post.get(name)
+            if self._needs_post:
+                # Query parameters take precedence over post data.
+                source = ChainMap(query, await request.post())
+
+            # Accessors are in the same order as `ACCESSOR_ORDER`.
+            getters = (
+                lambda name: instance,
+                info.get,
+                lambda name: request,
+                query.get,
+                source.get,
+            )
+            for name, index in self._accessors:
+                kwargs[name] = getters[index](name)
 
             # Execute the handler
             result = await self.program(**kwargs)
-            if isinstance(result, str):
-                return web.Response(text=result, content_type="text/html")
-
-            if self.template:
-                template = self.template_environment.get_template(
-                    self.template
-                )
-                text = await template.render_async(**result)
-                return web.Response(text=text, content_type="text/html")
+
+        if isinstance(result, str):
+            return Response(text=result, content_type=HTML_CONTENT_TYPE)
+
+        if self.template_obj:
+            text = await self.template_obj.render_async(**result)
+            return Response(text=text, content_type=HTML_CONTENT_TYPE)
@@ -29,19 +29,26 @@
 
 """Pygweblet router."""
 
+from itertools import chain
 from operator import attrgetter
 from pathlib import Path
+import re
 from types import ModuleType
 from typing import Dict, Tuple, Union, TYPE_CHECKING
 
+from pygweblet.files import compile_file, iter_public_files
 from pygweblet.route import PygWebRoute
 
 if TYPE_CHECKING:
     from pygweblet.server import PygWebServer
 
 # Constants
-WEB_METHODS = {"DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT"}
-WEB_METHODS_TO_ADD = {"GET", "POST"}
+WEB_METHODS = frozenset(
+    {"DELETE", "GET", "HEAD", "OPTIONS", "PATCH", "POST", "PUT"}
+)
+WEB_METHODS_TO_ADD = frozenset({"GET", "POST"})
+METHOD_NAMES = {method.lower(): method for method in WEB_METHODS}
+DYNAMIC_PART = re.compile(r"/\(([^/]*)\)(?=/|$)")
 
 
 class PygWebRouter:
@@ -66,18 +73,15 @@ class PygWebRouter:
         self._routes: Dict[Tuple[str, str], PygWebRoute] = {}
 
     def __repr__(self):
-        lines = ["<PygWebRouter("]
-        for route in self:
-            lines.append(" " * 4 + repr(route))
-        lines.append(")>")
-        return "\n".join(lines)
+        routes = (" " * 4 + repr(route) for route in self)
+        return "\n".join(chain(["<PygWebRouter("], routes, [")>"]))
 
     def __str__(self):
-        lines = ["PygWebRouter("]
-        for route in sorted(self, key=attrgetter("path", "method")):
-            lines.append(" " * 4 + str(route))
-        lines.append(")")
-        return "\n".join(lines)
+        routes = (
+            " " * 4 + str(route)
+            for route in sorted(self, key=attrgetter("path", "method"))
+        )
+        return "\n".join(chain(["PygWebRouter("], routes, [")"]))
 
     def __iter__(self):
         return iter(self._routes.values())
@@ -103,12 +107,7 @@ class PygWebRouter:
             program_dir (Path): the directory containing programs.
 
         """
-        for file_path in program_dir.rglob("*.py"):
-            if file_path.name.startswith("_") or any(
-                path.name.startswith("_") for path in file_path.parents
-            ):
-                continue
-
+        for file_path in iter_public_files(program_dir, ".py"):
             # The path may contain characters that disqualify
             # it from being a Python module.  So we open the file
             # and execute it.
@@ -117,24 +116,23 @@ class PygWebRouter:
             self._load_program(path, file_path)
 
     def _load_program(self, path: str, file_path: Path) -> None:
-        """Load a program, reading and executing the Python file.
+        """Load a program, compiling and executing the Python file.
 
         Args:
             path (str): the URI's path.
             file_path (Path): the path to the Python file.
 
         """
-        with file_path.open("r", encoding="utf-8") as file:
-            contents = file.read()
+        code = compile_file(file_path.as_posix(), file_path.stat().st_mtime)
 
-        # Create a module and execute the contents as Python.
+        # Create a module and execute the code.
         module = ModuleType(f"virtual module at {file_path.as_posix()}")
-        exec(contents, module.__dict__)
+        exec(code, module.__dict__)
 
         # Create corresponding routes.
-        for method in WEB_METHODS:
-            handler = getattr(module, method.lower(), None)
-            if handler is not None:
+        for name, handler in module.__dict__.items():
+            method = METHOD_NAMES.get(name)
+            if method is not None and callable(handler):
                 self._routes[(method, path)] = PygWebRoute(
                     self, path, method, program=handler, program_path=file_path
                 )
@@ -146,12 +144,7 @@ class PygWebRouter:
             template_dir (Path): the directory containing templates.
 
         """
-        for file_path in template_dir.rglob("*.jj2"):
-            if file_path.name.startswith("_") or any(
-                path.name.startswith("_") for path in file_path.parents
-            ):
-                continue
-
+        for file_path in iter_public_files(template_dir, ".jj2"):
             template_path = file_path.relative_to(template_dir)
             file_path = file_path.relative_to(template_dir.parent)
             path = self._make_path_from(template_path)
@@ -176,18 +169,19 @@ class PygWebRouter:
         else:
             methods = tuple(WEB_METHODS_TO_ADD)
 
+        # Compile the template once, routes will render it directly.
         environment = self.server.template_environment
+        template = environment.get_template(file_path.as_posix())
         for method in methods:
             # Add this template to the specific method's route,
             # or create a new route if necessary.
             route = self._routes.get((method, path))
-            environment.get_template(file_path.as_posix())
-            if route:
-                route.template = file_path.as_posix()
-            else:
-                self._routes[(method, path)] = PygWebRoute(
-                    self, path, method, template=file_path.as_posix()
-                )
+            if route is None:
+                route = PygWebRoute(self, path, method)
+                self._routes[(method, path)] = route
+
+            route.template = file_path.as_posix()
+            route.template_obj = template
 
     @staticmethod
     def _make_path_from(path: Path) -> str:
@@ -197,20 +191,10 @@ class PygWebRouter:
             path (Path): the path name.
 
         """
-        parts = []
         parent = path.parent.as_posix()
-        if parent != ".":
-            parts += parent.split("/")
-
+        uri = "" if parent == "." else "/" + parent
         stem = path.stem
-        if stem == "index":
-            parts.append("")
-        else:
-            parts.append(stem)
+        uri += "/" if stem == "index" else "/" + stem
 
         # Replace dynamic URI parts.
-        for i, part in enumerate(parts):
-            if part.startswith("(") and part.endswith(")"):
-                parts[i] = "{" + part[1:-1] + "}"
-
-        return "/" + "/".join(parts)
+        return DYNAMIC_PART.sub(r"/{\1}", uri)
@@ -0,0 +1,99 @@
+# Copyright (c) 2022, LE GOFF Vincent
+# All rights reserved.
+
+# Redistribution and use in source and binary forms, with or without
+# modification, are permitted provided that the following conditions are met:
+
+# * Redistributions of source code must retain the above copyright notice, this
+#   list of conditions and the following disclaimer.
+
+# * Redistributions in binary form must reproduce the above copyright notice,
+#   this list of conditions and the following disclaimer in the documentation
+#   and/or other materials provided with the distribution.
+
+# * Neither the name of ytranslate nor the names of its
+#   contributors may be used to endorse or promote products derived from
+#   this software without specific prior written permission.
+
+# THIS SOFTWARE IS PROVIDED BY THE COPYRIGHT HOLDERS AND CONTRIBUTORS "AS IS"
+# AND ANY EXPRESS OR IMPLIED WARRANTIES, INCLUDING, BUT NOT LIMITED TO, THE
+# IMPLIED WARRANTIES OF MERCHANTABILITY AND FITNESS FOR A PARTICULAR PURPOSE
+# ARE DISCLAIMED. IN NO EVENT SHALL THE COPYRIGHT HOLDER OR CONTRIBUTORS
+# BE LIABLE FOR ANY DIRECT, INDIRECT, INCIDENTAL, SPECIAL, EXEMPLARY,
+# OR CONSEQUENTIAL DAMAGES (INCLUDING, BUT NOT LIMITED TO, PROCUREMENT OF
+# SUBSTITUTE GOODS OR SERVICES; LOSS OF USE, DATA, OR PROFITS; OR BUSINESS
+# INTERRUPTION) HOWEVER CAUSED AND ON ANY THEORY OF LIABILITY, WHETHER
+# IN CONTRACT, STRICT LIABILITY, OR TORT (INCLUDING NEGLIGENCE OR OTHERWISE)
+# ARISING IN ANY WAY OUT OF THE USE OF THIS SOFTWARE, EVEN IF ADVISED OF THE
+# POSSIBILITY OF SUCH DAMAGE.
+
+"""JSON serialization, using orjson when it is installed."""
+
+import json
+from typing import Any, Union
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover
+    orjson = None
+
+# Raised when parsing invalid JSON, orjson's error inherits from it.
+JSONDecodeError = json.JSONDecodeError
+
+# Options given to orjson: accept non-string keys like the standard
+# library, and refuse datetimes and dataclasses like it does.
+if orjson is not None:
+    ORJSON_OPTIONS = (
+        orjson.OPT_NON_STR_KEYS
+        | orjson.OPT_PASSTHROUGH_DATETIME
+        | orjson.OPT_PASSTHROUGH_DATACLASS
+    )
+
+
+def dumps(obj: Any) -> str:
+    """Serialize an object to a JSON-formatted string.
+
+    orjson is used when installed.  Objects orjson refuses (integers
+    above 64 bits, datetimes or dataclasses, for instance) are given
+    to the standard library instead, which serializes them or raises
+    `TypeError`.  Some differences remain when orjson is installed:
+    the result is more compact, `UUID` and `Enum` values are
+    serialized instead of raising `TypeError`, and NaN and infinity
+    become `null` instead of `NaN` and `Infinity`.
+
+    Args:
+        obj (Any): the object to serialize.
+
+    Returns:
+        serialized (str): the JSON-formatted string.
+
+    Raises:
+        TypeError: the object can't be serialized.
+
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(obj, option=ORJSON_OPTIONS).decode("utf-8")
+        except TypeError:
+            pass
+
+    return json.dumps(obj)
+
+
+def loads(data: Union[str, bytes]) -> Any:
+    """Parse a JSON document.
+
+    Args:
+        data (str or bytes): the JSON document to parse.
+
+    Returns:
+        obj (Any): the parsed object.
+
+    Raises:
+        JSONDecodeError: the document isn't valid JSON.
+
+    """
+    if orjson is not None:
+        return orjson.loads(data)
+
+    return json.loads(data)
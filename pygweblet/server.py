@@ -31,15 +31,24 @@
 
 import asyncio
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
+import aiohttp
 from aiohttp import web
-from jinja2 import Environment
+from jinja2 import Environment, FileSystemBytecodeCache
 
-from pygweblet.router import PygWebRouter
+from pygweblet.router import PygWebRouter, WEB_METHODS
 from pygweblet.template_loader import PygWebTemplateLoader
 from pygweblet.websocket import PygWebWSRouter
 
+try:
+    import uvloop
+except ImportError:  # pragma: no cover
+    uvloop = None
+
+# Constants
+AIO_METHODS = {method: getattr(web, method.lower()) for method in WEB_METHODS}
+
 
 class PygWebServer:
 
@@ -61,43 +70,111 @@ class PygWebServer:
 
         asyncio.run(main())
 
+    Or, if the server is the only thing the process runs, call its
+    `run` method, which blocks until the server is cancelled and uses
+    uvloop if it's installed:
+
+        server = PygWebServer("site", 8000)
+        server.run()
+
     Construction parameters:
 
         -   `base_dir`: the base directory, as a string or
                 a `pathlib.Path` object, representing the directory
                 where the routes should be found.
         -   `port`: the port on which to listen for this server.
+        -   `reuse_port`: whether to set `SO_REUSEPORT` on the
+                listening socket.  Several processes running a server
+                on the same port with this option share incoming
+                connections, the kernel balancing them across processes
+                (and thus, across cores).  False by default.
+        -   `backlog`: the maximum number of pending connections
+                (1024 by default).
+        -   `template_cache_dir`: the directory, as a string or
+                a `pathlib.Path` object, in which to store compiled
+                templates, so they don't have to be compiled again when
+                the server restarts.  The directory is created if it
+                doesn't exist.  None by default (no cache).
+
+    While the server runs, `client_session` holds an
+    `aiohttp.ClientSession` that programs and packets can share
+    to send HTTP requests, reusing connections instead of opening
+    a new session for each request.  Programs can read it from
+    `request.app["client_session"]`, packets receive it in their
+    `client_session` parameter, if they have one.
 
     """
 
-    def __init__(self, base_dir: Union[str, Path], port: int):
+    def __init__(
+        self,
+        base_dir: Union[str, Path],
+        port: int,
+        reuse_port: bool = False,
+        backlog: int = 1024,
+        template_cache_dir: Optional[Union[str, Path]] = None,
+    ):
         self.base_dir = base_dir
         self.interface = "127.0.0.1"
         self.port = port
+        self.reuse_port = reuse_port
+        self.backlog = backlog
         self.app = web.Application()
         self.runner = web.AppRunner(self.app)
         self.serving_task = None
-        self.stop_event = asyncio.Event()
+        self.stop_event: Optional[asyncio.Event] = None
+        self._cancelled = False
+        self.client_session: Optional[aiohttp.ClientSession] = None
+        self.app.on_startup.append(self._open_client_session)
+        self.app.on_cleanup.append(self._close_client_session)
         self.router = PygWebRouter(self)
         self.ws_router = PygWebWSRouter(self)
+        bytecode_cache = None
+        if template_cache_dir is not None:
+            template_cache_dir = Path(template_cache_dir)
+            template_cache_dir.mkdir(parents=True, exist_ok=True)
+            bytecode_cache = FileSystemBytecodeCache(str(template_cache_dir))
+
         self.template_environment = Environment(
-            enable_async=True, loader=PygWebTemplateLoader(Path(base_dir))
+            enable_async=True,
+            loader=PygWebTemplateLoader(Path(base_dir)),
+            bytecode_cache=bytecode_cache,
         )
         self._loaded = False
 
+    def run(self):
+        """Run the web server until it's cancelled, blocking.
+
+        This method creates its own event loop, and uses uvloop's
+        if uvloop is installed.
+
+        """
+        if uvloop is not None:
+            asyncio.set_event_loop_policy(uvloop.EventLoopPolicy())
+
+        asyncio.run(self.serve())
+
     async def serve(self):
         """Start the web server, listening to connections."""
         if not self._loaded:
             self.load()
 
+        # The event is created in the running loop (see `run`).
+        self.stop_event = asyncio.Event()
+        if self._cancelled:
+            # The server was cancelled before being started.
+            return
+
         self.serving_task = asyncio.create_task(self._serve())
         await self.stop_event.wait()
+        await self._close_client_session(self.app)
 
     def cancel(self):
         """If started, cancel the webserver's task, stop lstening."""
+        self._cancelled = True
         if self.serving_task:
             self.serving_task.cancel()
-        self.stop_event.set()
+        if self.stop_event:
+            self.stop_event.set()
 
     def load(self):
         """Load the resources from the file system."""
@@ -106,17 +183,17 @@ class PygWebServer:
 
         self.router.load(self.base_dir)
         self.ws_router.load(self.base_dir)
-        aio_routes = []
         for route in self.router:
-            aio_method = getattr(web, route.method.lower(), None)
-            if aio_method is None:
+            if route.method not in AIO_METHODS:
                 raise ValueError(
                     f"Method {route.method} for route {route.path} "
                     "cannot be found"
                 )
 
-            aio_routes.append(aio_method(route.path, route.handle))
-
+        aio_routes = [
+            AIO_METHODS[route.method](route.path, route.handle)
+            for route in self.router
+        ]
         self.app.add_routes(aio_routes)
         self._loaded = True
 
@@ -132,10 +209,41 @@ class PygWebServer:
     async def serve_web(self):
         """Asynchronously start the web server."""
         await self.runner.setup()
-        site = web.TCPSite(self.runner, self.interface, self.port)
+        site = web.TCPSite(
+            self.runner,
+            self.interface,
+            self.port,
+            reuse_port=self.reuse_port,
+            backlog=self.backlog,
+        )
         await site.start()
         self.serving_task = None
 
+    async def _open_client_session(self, app: web.Application):
+        """Open the shared client session, when the application starts.
+
+        Args:
+            app (Application): the application being started.
+
+        """
+        self.client_session = aiohttp.ClientSession(
+            connector=aiohttp.TCPConnector(
+                limit=100, limit_per_host=20, keepalive_timeout=30
+            )
+        )
+        app["client_session"] = self.client_session
+
+    async def _close_client_session(self, app: web.Application):
+        """Close the shared client session, if open.
+
+        Args:
+            app (Application): the application being cleaned up.
+
+        """
+        if self.client_session is not None:
+            await self.client_session.close()
+            self.client_session = None
+
     def add_websocket(self, route: str):
         """Add a route for a WebSocket endpoint.
 
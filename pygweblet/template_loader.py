@@ -63,12 +63,12 @@ class PygWebTemplateLoader(BaseLoader):
 
         """
         path = self.path / template
-        if not path.exists():
+        try:
+            mtime = path.stat().st_mtime
+        except (FileNotFoundError, NotADirectoryError):
             raise TemplateNotFound(template)
 
-        mtime = path.stat().st_mtime
-        with path.open("r", encoding="utf-8") as file:
-            source = file.read()
+        source = path.read_text(encoding="utf-8")
 
         def is_modified() -> bool:
             return mtime == path.stat().st_mtime
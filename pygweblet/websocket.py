@@ -30,22 +30,67 @@
 """Pygweblet WebSocket router."""
 
 from asyncio import iscoroutinefunction
+from concurrent.futures import ThreadPoolExecutor
 from inspect import isasyncgenfunction
-import json
 from operator import attrgetter
 from pathlib import Path
-from types import ModuleType
-from typing import Any, Dict, Tuple, Union, TYPE_CHECKING
+from types import CodeType
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Optional,
+    Tuple,
+    Type,
+    Union,
+    TYPE_CHECKING,
+)
 
 import aiohttp
 from aiohttp import web
-from pydantic import ValidationError
+from pydantic import BaseModel, validate_model
 
+from pygweblet.files import compile_file, iter_public_files
 from pygweblet.packet import PygWebPacket
+from pygweblet.serialization import JSONDecodeError, dumps, loads
 
 if TYPE_CHECKING:
     from pygweblet.server import PygWebServer
 
+# Constants
+ERROR_NOT_A_LIST = (
+    "the packet should be a list [packet name, {arg1: whatever, ...}]"
+)
+ERROR_NOT_TWO_ELEMENTS = (
+    "two (2) elements should be included in the list: "
+    "the packet name (as a string) and the argments "
+    "(as a dictionary).  It can be an empty dictionary, "
+    "but it has to be present."
+)
+ERROR_INVALID_KEYS = (
+    "the second element should be a dictionary containing "
+    "only strings as keys.  The specified arguments aren't valid."
+)
+
+BY_PATH = attrgetter("path")
+WS_TEXT = aiohttp.WSMsgType.TEXT
+WS_ERROR = aiohttp.WSMsgType.ERROR
+
+# Error messages that never change are serialized once.
+ERROR_FRAMES = {
+    message: dumps({"error": message})
+    for message in (
+        ERROR_NOT_A_LIST,
+        ERROR_NOT_TWO_ELEMENTS,
+        ERROR_INVALID_KEYS,
+    )
+}
+
+
+class PacketParseError(ValueError):
+
+    """Error raised when a WebSocket packet cannot be parsed."""
+
 
 class PygWebWSRouter:
 
@@ -60,6 +105,11 @@ class PygWebWSRouter:
     def __init__(self, server: "PygWebServer"):
         self.server = server
         self._packets: Dict[str, PygWebPacket] = {}
+        self._handlers: Dict[str, Tuple[Type[BaseModel], Callable]] = {}
+        self._coroutines: Dict[
+            Path, Tuple[float, Tuple[Tuple[str, Callable], ...]]
+        ] = {}
+        self._sorted: Optional[Tuple[PygWebPacket, ...]] = None
 
     def __repr__(self):
         lines = ["<PygWebWSRouter("]
@@ -70,7 +120,10 @@ class PygWebWSRouter:
 
     def __str__(self):
         lines = ["PygWebWSRouter("]
-        for packet in sorted(self, key=attrgetter("path")):
+        if self._sorted is None:
+            self._sorted = tuple(sorted(self, key=BY_PATH))
+
+        for packet in self._sorted:
             lines.append(" " * 4 + str(packet))
         lines.append(")")
         return "\n".join(lines)
@@ -90,46 +143,106 @@ class PygWebWSRouter:
             base_dir = Path(base_dir)
 
         packet_dir = base_dir / "packets"
-        for file_path in packet_dir.rglob("*.py"):
-            if file_path.name.startswith("_") or any(
-                path.name.startswith("_") for path in file_path.parents
-            ):
-                continue
+        file_paths = list(iter_public_files(packet_dir, ".py"))
 
+        # Reading files is mostly waiting for I/O, so files are read
+        # and compiled in threads.  They are executed in order.
+        with ThreadPoolExecutor() as executor:
+            compiled = list(executor.map(self._compile_packet, file_paths))
+
+        for file_path, (mtime, code) in zip(file_paths, compiled):
             # The path may contain characters that disqualify
-            # it from being a Python module.  So we open the file
+            # it from being a Python module.  So we compile the file
             # and execute it.
             packet_path = file_path.relative_to(packet_dir)
-            self._load_packet(file_path, packet_path)
+            self._load_packet(file_path, packet_path, mtime, code)
+
+    def _compile_packet(
+        self, file_path: Path
+    ) -> Tuple[float, Optional[CodeType]]:
+        """Compile a packet file, unless it hasn't changed.
 
-    def _load_packet(self, file_path: Path, relative: Path):
-        """Load packets, reading and executing the Python file.
+        This method may be called from another thread.
 
         Args:
             file_path (Path): the path to the Python file.
 
+        Returns:
+            mtime, code (tuple): the file's modification time and its
+                    compiled code, or None if the file hasn't changed
+                    since it was last loaded.
+
         """
-        with file_path.open("r", encoding="utf-8") as file:
-            contents = file.read()
+        mtime = file_path.stat().st_mtime
+        cached = self._coroutines.get(file_path)
+        if cached is not None and cached[0] == mtime:
+            return mtime, None
+
+        return mtime, compile_file(file_path.as_posix(), mtime)
+
+    def _load_packet(
+        self,
+        file_path: Path,
+        relative: Path,
+        mtime: float,
+        code: Optional[CodeType],
+    ):
+        """Load packets, executing the compiled Python file.
 
-        # Create a module and execute the contents as Python.
-        module = ModuleType(f"virtual module at {file_path.as_posix()}")
-        exec(contents, module.__dict__)
+        Args:
+            file_path (Path): the path to the Python file.
+            relative (Path): the path relative to the packet directory.
+            mtime (float): the file's modification time.
+            code (CodeType or None): the compiled code, or None to reuse
+                    the coroutines found when the file was last loaded.
+
+        """
+        if code is None:
+            coroutines = self._coroutines[file_path][1]
+        else:
+            # Execute the code in a namespace, as a module would.
+            module_name = f"virtual module at {file_path.as_posix()}"
+            namespace = {"__name__": module_name}
+            exec(code, namespace)
+            coroutines = self._find_coroutines(namespace)
+            self._coroutines[file_path] = (mtime, coroutines)
 
         # Create corresponding packets.
-        for name, value in module.__dict__.items():
+        for name, value in coroutines:
+            packet_path = self._make_path_for(relative, name)
+            packet = PygWebPacket.from_coroutine(self, packet_path, value)
+            self._packets[packet_path] = packet
+            self._handlers[packet_path] = (packet.validator, packet.handle)
+            self._sorted = None
+
+    @staticmethod
+    def _find_coroutines(
+        namespace: Dict[str, Any]
+    ) -> Tuple[Tuple[str, Callable], ...]:
+        """Find the public coroutines defined in a module namespace.
+
+        Args:
+            namespace (dict): the namespace in which the code was executed.
+
+        Returns:
+            coroutines (tuple): the (name, coroutine) pairs, coroutines
+                    being coroutine functions or async generators.
+
+        """
+        module_name = namespace["__name__"]
+        coroutines = []
+        for name, value in namespace.items():
             if name.startswith("_"):
                 continue
 
-            if getattr(value, "__module__", "") != module.__name__:
+            if getattr(value, "__module__", "") != module_name:
                 # `value` hasn't been defined in this module.
                 continue
 
             if iscoroutinefunction(value) or isasyncgenfunction(value):
-                # Add the packet.
-                packet_path = self._make_path_for(relative, name)
-                packet = PygWebPacket.from_coroutine(self, packet_path, value)
-                self._packets[packet_path] = packet
+                coroutines.append((name, value))
+
+        return tuple(coroutines)
 
     async def handle(self, request: web.Request) -> web.WebSocketResponse:
         """Handle a WebSocket connection.
@@ -142,10 +255,12 @@ class PygWebWSRouter:
         """
         ws = web.WebSocketResponse()
         await ws.prepare(request)
+        handle_message = self.handle_message
         async for msg in ws:
-            if msg.type == aiohttp.WSMsgType.TEXT:
-                await self.handle_message(ws, msg.data)
-            elif msg.type == aiohttp.WSMsgType.ERROR:
+            msg_type = msg.type
+            if msg_type == WS_TEXT:
+                await handle_message(ws, msg.data)
+            elif msg_type == WS_ERROR:
                 break
 
         return ws
@@ -170,80 +285,93 @@ class PygWebWSRouter:
             message (str): the message to parse.
 
         """
-        result = self.parse(message)
-        if isinstance(result, str):
+        try:
+            path, args = self.parse(message)
+        except PacketParseError as err:
             # That's an error, send it to the WebSocketClient.
-            await ws.send_str(json.dumps({"error": result}))
+            await self.send_error(ws, str(err))
         else:
             # This is a correct packet, but it might not be valid regardless.
-            path, args = result
-            packet = self._packets.get(path)
-            if packet is None:
+            handlers = self._handlers.get(path)
+            if handlers is None:
                 error = f"the packet name {path} is not valid"
-                await ws.send_str(json.dumps({"error": error}))
+                await self.send_error(ws, error)
             else:
                 # Validate the data for this packet.
-                try:
-                    arguments = packet.validator(**result[1])
-                except ValidationError as err:
-                    await ws.send_str(json.dumps({"error": str(err)}))
+                # The model itself isn't created, only its values are used.
+                validator, handle = handlers
+                arguments, _, error = validate_model(validator, args)
+                if error is not None:
+                    await self.send_error(ws, str(error))
                 else:
-                    await packet.handle(ws, arguments.dict())
+                    await handle(ws, arguments)
+
+    @staticmethod
+    async def send_error(ws: web.WebSocketResponse, message: str):
+        """Send an error message to the WebSocket client.
+
+        Args:
+            ws (WebSocketResponse): the websocket response.
+            message (str): the error message.
 
-    def parse(self, message: str) -> Union[str, Tuple[str, Dict[str, Any]]]:
+        """
+        frame = ERROR_FRAMES.get(message)
+        if frame is None:
+            await ws.send_json({"error": message}, dumps=dumps)
+        else:
+            await ws.send_str(frame)
+
+    def parse(
+        self, message: Union[str, bytes]
+    ) -> Tuple[str, Dict[str, Any]]:
         """Try and parse a JSON packet.
 
         Args:
-            message (str): the JSON packet.
+            message (str or bytes): the JSON packet.
 
         Returns:
-            packet or error: the packet, as a tuple of
-                    (packet_path, argments as dict) or an error message
-                    (as str).
+            packet (tuple): the packet, as a tuple of
+                    (packet_path, argments as dict).
+
+        Raises:
+            PacketParseError: the packet isn't valid, the exception
+                    contains the error message.
 
         """
         try:
-            parsed: Tuple[str, Dict[str, Any]] = json.loads(message)
-        except json.JSONDecodeError as err:
-            return str(err)
-
-        if not isinstance(parsed, list):
-            return (
-                "the packet should be a list [packet name, "
-                "{arg1: whatever, ...}]"
-            )
+            parsed: Tuple[str, Dict[str, Any]] = loads(message)
+        except JSONDecodeError as err:
+            raise PacketParseError(str(err))
+
+        # JSON parsers only create exact built-in types, so
+        # `type(...) is` is enough and cheaper than `isinstance`.
+        if type(parsed) is not list:
+            raise PacketParseError(ERROR_NOT_A_LIST)
 
         # This list should contain only two elements.
         if len(parsed) != 2:
-            return (
-                "two (2) elements should be included in the list: "
-                "the packet name (as a string) and the argments "
-                "(as a dictionary).  It can be an empty dictionary, "
-                "but it has to be present."
-            )
+            raise PacketParseError(ERROR_NOT_TWO_ELEMENTS)
 
         # The first element should be a string.
-        if not isinstance(parsed[0], str):
-            return (
+        path, args = parsed
+        if type(path) is not str:
+            raise PacketParseError(
                 "the first element should be a string, but "
-                f"{type(parsed[0])} received"
+                f"{type(path)} received"
             )
 
         # The second element should be a dictionary.
-        if not isinstance(parsed[1], dict):
-            return (
+        if type(args) is not dict:
+            raise PacketParseError(
                 "the second element should be a dictionary, but "
-                f"{type(parsed[1])} received"
+                f"{type(args)} received"
             )
 
         # The second element (a dict) should contain only strings as keys.
-        if not all(isinstance(key, str) for key in parsed[1].keys()):
-            return (
-                "the second element should be a dictionary containing "
-                "only strings as keys.  The specified arguments aren't valid."
-            )
+        if any(type(key) is not str for key in args):
+            raise PacketParseError(ERROR_INVALID_KEYS)
 
-        return tuple(parsed)
+        return path, args
 
     @staticmethod
     def _make_path_for(path: Path, name: str) -> str: